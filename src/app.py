@@ -8,6 +8,7 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from dataclasses import dataclass
 import os
 from pathlib import Path
 
@@ -19,62 +20,72 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+
+@dataclass(slots=True)
+class Activity:
+    """An extracurricular activity and the students signed up for it"""
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
+
+
 # In-memory activity database
 activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    "Basketball Team": {
-        "description": "Competitive basketball team for intramural and varsity play",
-        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
-    },
-    "Tennis Club": {
-        "description": "Learn tennis skills and participate in friendly matches",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["chris@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Perform in theatrical productions and develop acting skills",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 25,
-        "participants": ["maya@mergington.edu", "james@mergington.edu"]
-    },
-    "Art Studio": {
-        "description": "Explore painting, drawing, and sculpture techniques",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 18,
-        "participants": ["isabella@mergington.edu"]
-    },
-    "Robotics Club": {
-        "description": "Design and build robots for competitions",
-        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-    },
-    "Science Olympiad": {
-        "description": "Compete in science competitions and experiments",
-        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 14,
-        "participants": ["ava@mergington.edu"]
-    }
+    "Chess Club": Activity(
+        description="Learn strategies and compete in chess tournaments",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=12,
+        participants=["michael@mergington.edu", "daniel@mergington.edu"]
+    ),
+    "Programming Class": Activity(
+        description="Learn programming fundamentals and build software projects",
+        schedule="Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        max_participants=20,
+        participants=["emma@mergington.edu", "sophia@mergington.edu"]
+    ),
+    "Gym Class": Activity(
+        description="Physical education and sports activities",
+        schedule="Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        max_participants=30,
+        participants=["john@mergington.edu", "olivia@mergington.edu"]
+    ),
+    "Basketball Team": Activity(
+        description="Competitive basketball team for intramural and varsity play",
+        schedule="Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        max_participants=15,
+        participants=["alex@mergington.edu"]
+    ),
+    "Tennis Club": Activity(
+        description="Learn tennis skills and participate in friendly matches",
+        schedule="Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
+        max_participants=12,
+        participants=["chris@mergington.edu"]
+    ),
+    "Drama Club": Activity(
+        description="Perform in theatrical productions and develop acting skills",
+        schedule="Wednesdays, 3:30 PM - 5:00 PM",
+        max_participants=25,
+        participants=["maya@mergington.edu", "james@mergington.edu"]
+    ),
+    "Art Studio": Activity(
+        description="Explore painting, drawing, and sculpture techniques",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=18,
+        participants=["isabella@mergington.edu"]
+    ),
+    "Robotics Club": Activity(
+        description="Design and build robots for competitions",
+        schedule="Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        max_participants=16,
+        participants=["liam@mergington.edu", "noah@mergington.edu"]
+    ),
+    "Science Olympiad": Activity(
+        description="Compete in science competitions and experiments",
+        schedule="Tuesdays, 3:30 PM - 5:00 PM",
+        max_participants=14,
+        participants=["ava@mergington.edu"]
+    )
 }
 
 
@@ -98,12 +109,12 @@ def signup_for_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
     # Validate student is not already signed up
-    if email in activity["participants"]:
+    if email in activity.participants:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
 
     # Add student
-    activity["participants"].append(email)
+    activity.participants.append(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -117,9 +128,9 @@ def unregister_from_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
     # Validate student is registered
-    if email not in activity["participants"]:
+    if email not in activity.participants:
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    activity.participants.remove(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
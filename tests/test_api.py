@@ -2,95 +2,93 @@
 Tests for the Mergington High School API
 """
 
+from dataclasses import replace
+
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add the src directory to the path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import Activity, app, activities
+
+
+# URL-encoded activity names used in endpoint paths
+CHESS = "Chess%20Club"
+TENNIS = "Tennis%20Club"
+PROGRAMMING = "Programming%20Class"
+FAKE = "Fake%20Club"
+
+
+# Immutable template of the initial activities, taken from the app at import
+# before any test runs; participants are stored as tuples so the template
+# cannot be mutated and resets only need to allocate fresh lists
+_TEMPLATE = {
+    name: replace(activity, participants=tuple(activity.participants))
+    for name, activity in activities.items()
+}
+
 
-from app import app, activities
+def _fresh_activities():
+    """Build a new activities dict from the template with fresh participant lists"""
+    return {
+        name: replace(activity, participants=list(activity.participants))
+        for name, activity in _TEMPLATE.items()
+    }
+
+
+def body(response):
+    """Decode a response's JSON body with orjson"""
+    return orjson.loads(response.content)
 
 
-@pytest.fixture
+def participants_of(data, name):
+    """Return an activity's participants as a set, from a response body or the store"""
+    activity = data[name]
+    if isinstance(activity, Activity):
+        return set(activity.participants)
+    return set(activity["participants"])
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
+    """Create a test client for the FastAPI app, shared across the session"""
     return TestClient(app)
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store the original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team for intramural and varsity play",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn tennis skills and participate in friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["chris@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in theatrical productions and develop acting skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["maya@mergington.edu", "james@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Design and build robots for competitions",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science competitions and experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["ava@mergington.edu"]
-        }
-    }
-    
-    # Clear and repopulate activities
+@pytest_asyncio.fixture
+async def aclient():
+    """Create an async client that calls the app in-process over ASGI"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def _reset_activities():
+    """Clear and repopulate activities from the template"""
     activities.clear()
-    activities.update(original_activities)
-    
+    activities.update(_fresh_activities())
+
+
+@pytest.fixture(autouse=True)
+def restore_mutated_activities(request):
+    """Snapshot participants of the activities named by `mutates` markers and restore them after"""
+    names = [name for marker in request.node.iter_markers("mutates") for name in marker.args]
+    snapshots = {name: list(activities[name].participants) for name in names}
+
     yield
-    
-    # Reset again after test
-    activities.clear()
-    activities.update(original_activities)
+
+    for name, participants in snapshots.items():
+        activities[name].participants[:] = participants
 
 
+@pytest.fixture(scope="class")
+def reset_activities_once():
+    """Reset activities once per class so leaked state cannot cascade across classes"""
+    _reset_activities()
+
+
+@pytest.mark.usefixtures("reset_activities_once")
 class TestGetActivities:
     """Test the GET /activities endpoint"""
     
@@ -98,7 +96,7 @@ class TestGetActivities:
         """Test that GET /activities returns all activities"""
         response = client.get("/activities")
         assert response.status_code == 200
-        data = response.json()
+        data = body(response)
         assert len(data) == 9
         assert "Chess Club" in data
         assert "Programming Class" in data
@@ -106,7 +104,7 @@ class TestGetActivities:
     def test_get_activities_includes_activity_details(self, client):
         """Test that activities include all required fields"""
         response = client.get("/activities")
-        data = response.json()
+        data = body(response)
         chess_club = data["Chess Club"]
         
         assert "description" in chess_club
@@ -117,161 +115,168 @@ class TestGetActivities:
     def test_get_activities_includes_participants(self, client):
         """Test that activities include participant list"""
         response = client.get("/activities")
-        data = response.json()
-        chess_club = data["Chess Club"]
+        data = body(response)
+        participants = participants_of(data, "Chess Club")
         
-        assert len(chess_club["participants"]) == 2
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        assert len(data["Chess Club"]["participants"]) == 2
+        assert "michael@mergington.edu" in participants
+        assert "daniel@mergington.edu" in participants
 
 
+@pytest.mark.usefixtures("reset_activities_once")
 class TestSignup:
     """Test the POST /activities/{activity_name}/signup endpoint"""
     
+    @pytest.mark.mutates("Chess Club")
     def test_signup_successful(self, client):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            f"/activities/{CHESS}/signup",
+            params={"email": "newstudent@mergington.edu"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = body(response)
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        chess_club = activities_response.json()["Chess Club"]
-        assert "newstudent@mergington.edu" in chess_club["participants"]
+        assert "newstudent@mergington.edu" in activities["Chess Club"].participants
     
+    @pytest.mark.mutates("Chess Club")
     def test_signup_duplicate_student(self, client):
         """Test that a student cannot sign up twice"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu"
+            f"/activities/{CHESS}/signup",
+            params={"email": "michael@mergington.edu"},
         )
         assert response.status_code == 400
-        data = response.json()
+        data = body(response)
         assert "already signed up" in data["detail"]
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for a non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
-    
+    @pytest.mark.mutates("Tennis Club")
     def test_signup_multiple_students(self, client):
         """Test that multiple students can sign up"""
         # First signup
         response1 = client.post(
-            "/activities/Tennis%20Club/signup?email=student1@mergington.edu"
+            f"/activities/{TENNIS}/signup",
+            params={"email": "student1@mergington.edu"},
         )
         assert response1.status_code == 200
         
         # Second signup
         response2 = client.post(
-            "/activities/Tennis%20Club/signup?email=student2@mergington.edu"
+            f"/activities/{TENNIS}/signup",
+            params={"email": "student2@mergington.edu"},
         )
         assert response2.status_code == 200
         
         # Verify both are added
-        activities_response = client.get("/activities")
-        tennis_club = activities_response.json()["Tennis Club"]
-        assert "student1@mergington.edu" in tennis_club["participants"]
-        assert "student2@mergington.edu" in tennis_club["participants"]
-        assert len(tennis_club["participants"]) == 3
+        participants = participants_of(activities, "Tennis Club")
+        assert "student1@mergington.edu" in participants
+        assert "student2@mergington.edu" in participants
+        assert len(activities["Tennis Club"].participants) == 3
 
 
+@pytest.mark.usefixtures("reset_activities_once")
 class TestUnregister:
     """Test the POST /activities/{activity_name}/unregister endpoint"""
     
+    @pytest.mark.mutates("Chess Club")
     def test_unregister_successful(self, client):
         """Test successful unregistration from an activity"""
         response = client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
+            f"/activities/{CHESS}/unregister",
+            params={"email": "michael@mergington.edu"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = body(response)
         assert "Unregistered" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        chess_club = activities_response.json()["Chess Club"]
-        assert "michael@mergington.edu" not in chess_club["participants"]
+        assert "michael@mergington.edu" not in activities["Chess Club"].participants
     
+    @pytest.mark.mutates("Chess Club")
     def test_unregister_not_registered(self, client):
         """Test unregistering a student who is not registered"""
         response = client.post(
-            "/activities/Chess%20Club/unregister?email=notregistered@mergington.edu"
+            f"/activities/{CHESS}/unregister",
+            params={"email": "notregistered@mergington.edu"},
         )
         assert response.status_code == 400
-        data = response.json()
+        data = body(response)
         assert "not registered" in data["detail"]
     
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregistering from a non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
-    
+    @pytest.mark.mutates("Chess Club")
     def test_unregister_multiple_participants(self, client):
         """Test unregistering one participant doesn't affect others"""
         # Unregister first participant
         response1 = client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
+            f"/activities/{CHESS}/unregister",
+            params={"email": "michael@mergington.edu"},
         )
         assert response1.status_code == 200
         
         # Verify second participant is still there
-        activities_response = client.get("/activities")
-        chess_club = activities_response.json()["Chess Club"]
-        assert "michael@mergington.edu" not in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
-        assert len(chess_club["participants"]) == 1
+        participants = participants_of(activities, "Chess Club")
+        assert "michael@mergington.edu" not in participants
+        assert "daniel@mergington.edu" in participants
+        assert len(activities["Chess Club"].participants) == 1
+
+
+@pytest.mark.usefixtures("reset_activities_once")
+class TestNonexistentActivity:
+    """Test the activity endpoints with an activity that does not exist"""
+    
+    @pytest.mark.parametrize("endpoint", ["signup", "unregister"])
+    def test_nonexistent_activity(self, client, endpoint):
+        """Test that signup and unregister return 404 for a non-existent activity"""
+        response = client.post(
+            f"/activities/{FAKE}/{endpoint}",
+            params={"email": "student@mergington.edu"},
+        )
+        assert response.status_code == 404
+        data = body(response)
+        assert "not found" in data["detail"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_activities_once")
 class TestIntegration:
     """Integration tests for complete workflows"""
     
-    def test_signup_and_unregister_workflow(self, client):
+    @pytest.mark.mutates("Programming Class")
+    async def test_signup_and_unregister_workflow(self, aclient):
         """Test a complete signup and unregister workflow"""
         email = "workflow@mergington.edu"
-        activity = "Programming%20Class"
+        activity = PROGRAMMING
         
         # Get initial count
-        response = client.get("/activities")
-        initial_count = len(response.json()["Programming Class"]["participants"])
+        initial_count = len(activities["Programming Class"].participants)
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
+        signup_response = await aclient.post(
+            f"/activities/{activity}/signup", params={"email": email}
         )
         assert signup_response.status_code == 200
         
         # Verify signup
-        response = client.get("/activities")
-        after_signup_count = len(response.json()["Programming Class"]["participants"])
+        after_signup_count = len(activities["Programming Class"].participants)
         assert after_signup_count == initial_count + 1
         
         # Unregister
-        unregister_response = client.post(
-            f"/activities/{activity}/unregister?email={email}"
+        unregister_response = await aclient.post(
+            f"/activities/{activity}/unregister", params={"email": email}
         )
         assert unregister_response.status_code == 200
         
         # Verify unregister
-        response = client.get("/activities")
-        final_count = len(response.json()["Programming Class"]["participants"])
+        final_count = len(activities["Programming Class"].participants)
         assert final_count == initial_count
     
-    def test_availability_calculation(self, client):
+    async def test_availability_calculation(self, aclient):
         """Test that availability spots are calculated correctly"""
-        response = client.get("/activities")
-        data = response.json()
+        response = await aclient.get("/activities")
+        data = body(response)
         
         # Chess Club: max 12, has 2 participants, should have 10 spots left
         chess_club = data["Chess Club"]